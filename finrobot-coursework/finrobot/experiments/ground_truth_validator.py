@@ -11,7 +11,7 @@ quantitative validation of prediction accuracy.
 import json
 import time
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, fields
 from datetime import datetime, timedelta
 from pathlib import Path
 from enum import Enum
@@ -34,7 +34,7 @@ class PredictionType(Enum):
     TREND = "trend"  # bullish/bearish trend
 
 
-@dataclass
+@dataclass(slots=True)
 class Prediction:
     """A single prediction to be validated."""
 
@@ -271,12 +271,13 @@ class GroundTruthValidator:
             logger.error(f"Error fetching price for {ticker}: {e}")
             return 0.0
 
-    def validate_prediction(self, prediction_id: str) -> Prediction:
+    def validate_prediction(self, prediction_id: str, save: bool = True) -> Prediction:
         """
         Validate a specific prediction against actual outcomes.
 
         Args:
             prediction_id: ID of prediction to validate
+            save: Persist predictions after validating (batch callers save once)
 
         Returns:
             Updated Prediction with validation results
@@ -347,7 +348,8 @@ class GroundTruthValidator:
             # Direction-only prediction
             prediction.accuracy_score = 1.0 if prediction.directional_correct else 0.0
 
-        self.save_predictions()
+        if save:
+            self.save_predictions()
 
         logger.info(
             f"Validated {prediction_id}: {prediction.ticker} "
@@ -396,20 +398,27 @@ class GroundTruthValidator:
             List of newly validated predictions
         """
         validated = []
+        now = datetime.now()
 
-        for prediction_id in list(self.predictions.keys()):
-            prediction = self.predictions[prediction_id]
+        # Rewrite predictions.json once for the whole batch, not once per
+        # prediction; the finally keeps earlier results if a later one raises
+        try:
+            for prediction_id in list(self.predictions.keys()):
+                prediction = self.predictions[prediction_id]
 
-            if prediction.is_validated:
-                continue
+                if prediction.is_validated:
+                    continue
 
-            pred_time = datetime.fromisoformat(prediction.prediction_timestamp)
-            validation_time = pred_time + timedelta(days=prediction.timeframe_days)
+                pred_time = datetime.fromisoformat(prediction.prediction_timestamp)
+                validation_time = pred_time + timedelta(days=prediction.timeframe_days)
 
-            if datetime.now() >= validation_time:
-                result = self.validate_prediction(prediction_id)
-                if result.is_validated:
-                    validated.append(result)
+                if now >= validation_time:
+                    result = self.validate_prediction(prediction_id, save=False)
+                    if result.is_validated:
+                        validated.append(result)
+        finally:
+            if validated:
+                self.save_predictions()
 
         logger.info(f"Validated {len(validated)} due predictions")
         return validated
@@ -533,8 +542,10 @@ class GroundTruthValidator:
         filepath = self.storage_dir / "predictions.json"
         data = {pid: p.to_dict() for pid, p in self.predictions.items()}
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        # Rewritten on every recorded prediction and only read back by
+        # load_predictions, so skip pretty-printing
+        with open(filepath, "w", buffering=1 << 20) as f:
+            json.dump(data, f, separators=(",", ":"))
 
         logger.debug(f"Saved {len(self.predictions)} predictions to {filepath}")
 
@@ -576,19 +587,11 @@ class GroundTruthValidator:
 
         import csv
 
-        with open(output_path, "w", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=list(Prediction(
-                    prediction_id="", system_name="", model_name="",
-                    ticker="", task_name="", prediction_type="",
-                    predicted_value=""
-                ).to_dict().keys())
-            )
+        with open(output_path, "w", newline="", buffering=1 << 20) as f:
+            # Header straight from the dataclass; matches to_dict()'s key order
+            writer = csv.DictWriter(f, fieldnames=[fld.name for fld in fields(Prediction)])
             writer.writeheader()
-
-            for prediction in self.predictions.values():
-                writer.writerow(prediction.to_dict())
+            writer.writerows(p.to_dict() for p in self.predictions.values())
 
         logger.info(f"Exported validation report to {output_path}")
         return output_path
@@ -15,10 +15,15 @@ import re
 
 from finrobot.logging import get_logger, record_metric
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricSnapshot:
     """Captures a single measurement point during an experiment."""
 
@@ -247,10 +252,23 @@ class MetricsCollector:
             logger.warning(f"No metrics found for filter: {system_filter}")
             return {}
 
-        latencies = [m.latency_seconds for m in metrics if not m.error_occurred]
-        costs = [m.total_cost for m in metrics if not m.error_occurred]
-        tool_calls = [m.tool_calls_count for m in metrics]
-        reasoning_steps = [m.reasoning_steps for m in metrics]
+        return self._summarize(metrics)
+
+    @staticmethod
+    def _summarize(metrics: List[MetricSnapshot]) -> Dict[str, Any]:
+        """Aggregate statistics for a non-empty list of snapshots."""
+        # Gather everything in one pass over the snapshots
+        latencies: List[float] = []
+        costs: List[float] = []
+        tool_calls_total = 0
+        reasoning_steps_total = 0
+        for m in metrics:
+            tool_calls_total += m.tool_calls_count
+            reasoning_steps_total += m.reasoning_steps
+            if not m.error_occurred:
+                latencies.append(m.latency_seconds)
+                costs.append(m.total_cost)
+        errors = len(metrics) - len(latencies)
 
         def safe_avg(lst):
             return sum(lst) / len(lst) if lst else 0
@@ -264,7 +282,7 @@ class MetricsCollector:
 
         stats = {
             "count": len(metrics),
-            "errors": sum(1 for m in metrics if m.error_occurred),
+            "errors": errors,
             "latency": {
                 "mean": safe_avg(latencies),
                 "std": safe_std(latencies),
@@ -279,8 +297,8 @@ class MetricsCollector:
                 "total": sum(costs),
             },
             "reasoning": {
-                "avg_tool_calls": safe_avg(tool_calls),
-                "avg_reasoning_steps": safe_avg(reasoning_steps),
+                "avg_tool_calls": tool_calls_total / len(metrics),
+                "avg_reasoning_steps": reasoning_steps_total / len(metrics),
             },
         }
         return stats
@@ -307,11 +325,11 @@ class MetricsCollector:
         
         import csv
         
+        rows = [metric.to_dict() for metric in self.metrics]
         with open(output_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self.metrics[0].to_dict().keys())
+            writer = csv.DictWriter(f, fieldnames=rows[0].keys())
             writer.writeheader()
-            for metric in self.metrics:
-                writer.writerow(metric.to_dict())
+            writer.writerows(rows)
 
         logger.info(f"Exported {len(self.metrics)} metrics to {output_path}")
         return output_path
@@ -336,35 +354,45 @@ class MetricsCollector:
 
         output_path = self.output_dir / filename
         data = [m.to_dict() for m in self.metrics]
-        
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, "w") as f:
+                json.dump(data, f, indent=2)
 
         logger.info(f"Exported {len(self.metrics)} metrics to {output_path}")
         return output_path
 
     def print_summary(self):
         """Print human-readable summary of all metrics."""
-        print("\n" + "=" * 80)
-        print("EXPERIMENT METRICS SUMMARY")
-        print("=" * 80)
+        # Collect the report and emit it with a single write
+        lines: List[str] = []
+        lines.append("\n" + "=" * 80)
+        lines.append("EXPERIMENT METRICS SUMMARY")
+        lines.append("=" * 80)
 
         # Overall stats
         overall = self.get_statistics()
-        print(f"\nTotal Runs: {overall.get('count', 0)}")
-        print(f"Errors: {overall.get('errors', 0)}")
+        lines.append(f"\nTotal Runs: {overall.get('count', 0)}")
+        lines.append(f"Errors: {overall.get('errors', 0)}")
+
+        # Per-system stats: bucket the snapshots once instead of filtering per system
+        by_system: Dict[str, List[MetricSnapshot]] = {}
+        for m in self.metrics:
+            by_system.setdefault(m.system_name, []).append(m)
 
-        # Per-system stats
         for system in ["agent", "rag"]:
-            stats = self.get_statistics(system_filter=system)
-            if stats.get("count", 0) == 0:
+            if system not in by_system:
                 continue
+            stats = self._summarize(by_system[system])
 
-            print(f"\n{system.upper()} System:")
-            print(f"  Runs: {stats['count']}")
-            print(f"  Latency: {stats['latency']['mean']:.2f}s ± {stats['latency']['std']:.2f}s")
-            print(f"  Cost: ${stats['cost']['mean']:.4f} ± ${stats['cost']['std']:.4f}")
-            print(f"  Avg Tool Calls: {stats['reasoning']['avg_tool_calls']:.1f}")
-            print(f"  Total Cost: ${stats['cost']['total']:.2f}")
+            lines.append(f"\n{system.upper()} System:")
+            lines.append(f"  Runs: {stats['count']}")
+            lines.append(f"  Latency: {stats['latency']['mean']:.2f}s ± {stats['latency']['std']:.2f}s")
+            lines.append(f"  Cost: ${stats['cost']['mean']:.4f} ± ${stats['cost']['std']:.4f}")
+            lines.append(f"  Avg Tool Calls: {stats['reasoning']['avg_tool_calls']:.1f}")
+            lines.append(f"  Total Cost: ${stats['cost']['total']:.2f}")
 
-        print("\n" + "=" * 80)
+        lines.append("\n" + "=" * 80)
+        print("\n".join(lines))
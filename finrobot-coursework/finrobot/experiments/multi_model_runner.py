@@ -13,6 +13,7 @@ Supported models:
 
 import time
 import json
+from itertools import product
 from typing import List, Dict, Optional, Any, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -217,8 +218,9 @@ class MultiModelExperimentRunner:
             return
 
         try:
-            with open(self.cache_file, "w") as f:
-                json.dump(self.cache, f, indent=2)
+            # Machine-read only and rewritten after every experiment: keep it compact
+            with open(self.cache_file, "w", buffering=1 << 20) as f:
+                json.dump(self.cache, f, separators=(",", ":"))
         except Exception as e:
             logger.error(f"Could not save cache: {e}")
 
@@ -513,26 +515,25 @@ Do not use any external tools or data sources.
                 key = f"{system}_{model.name}"
                 results[key] = []
 
-                for ticker in plan.tickers:
-                    for task in plan.tasks:
-                        current += 1
-                        print(f"\n[{current}/{total}] {system} + {model.name} | {ticker} | {task['name']}")
+                for ticker, task in product(plan.tickers, plan.tasks):
+                    current += 1
+                    print(f"\n[{current}/{total}] {system} + {model.name} | {ticker} | {task['name']}")
 
-                        try:
-                            metric = self.run_single_experiment(
-                                system=system,
-                                model=model,
-                                ticker=ticker,
-                                task=task,
-                            )
-                            results[key].append(metric)
+                    try:
+                        metric = self.run_single_experiment(
+                            system=system,
+                            model=model,
+                            ticker=ticker,
+                            task=task,
+                        )
+                        results[key].append(metric)
 
-                            print(f"  ✓ Completed in {metric.latency_seconds:.2f}s")
+                        print(f"  ✓ Completed in {metric.latency_seconds:.2f}s")
 
-                        except Exception as e:
-                            logger.error(f"Failed: {e}")
-                            print(f"  ✗ Failed: {e}")
-                            continue
+                    except Exception as e:
+                        logger.error(f"Failed: {e}")
+                        print(f"  ✗ Failed: {e}")
+                        continue
 
         logger.info(f"Experiment plan complete: {current} experiments run")
         return results
@@ -594,36 +595,39 @@ Do not use any external tools or data sources.
 
     def print_summary(self, analysis: Dict[str, Any]):
         """Print human-readable summary."""
-        print("\n" + "=" * 80)
-        print("MULTI-MODEL EXPERIMENT SUMMARY")
-        print("=" * 80)
+        # Collect the report and emit it with a single write
+        lines: List[str] = []
+        lines.append("\n" + "=" * 80)
+        lines.append("MULTI-MODEL EXPERIMENT SUMMARY")
+        lines.append("=" * 80)
 
         summary = analysis['summary']
-        print(f"\nTotal Experiments: {summary['total_experiments']}")
-        print(f"Systems: {', '.join(summary['systems_compared'])}")
-        print(f"Models: {', '.join(summary['models_compared'])}")
+        lines.append(f"\nTotal Experiments: {summary['total_experiments']}")
+        lines.append(f"Systems: {', '.join(summary['systems_compared'])}")
+        lines.append(f"Models: {', '.join(summary['models_compared'])}")
 
-        print("\n" + "-" * 80)
-        print("STATISTICAL RESULTS")
-        print("-" * 80)
+        lines.append("\n" + "-" * 80)
+        lines.append("STATISTICAL RESULTS")
+        lines.append("-" * 80)
 
         comp = analysis['statistical_comparison']
-        print(f"Overall Best System: {comp['overall_best_system']}")
-        print(f"Confidence: {comp['confidence_score']:.1%}")
+        lines.append(f"Overall Best System: {comp['overall_best_system']}")
+        lines.append(f"Confidence: {comp['confidence_score']:.1%}")
 
-        print("\n" + "-" * 80)
-        print("GROUND TRUTH VALIDATION")
-        print("-" * 80)
+        lines.append("\n" + "-" * 80)
+        lines.append("GROUND TRUTH VALIDATION")
+        lines.append("-" * 80)
 
         for key, report in analysis['validation_reports'].items():
             if report['validated_predictions'] == 0:
                 continue
-            print(f"\n{key}:")
-            print(f"  Accuracy: {report['overall_accuracy']:.3f}")
-            print(f"  Directional Accuracy: {report['directional_accuracy']:.1%}")
-            print(f"  Mean Error: {report['mean_magnitude_error']:.2f}%")
+            lines.append(f"\n{key}:")
+            lines.append(f"  Accuracy: {report['overall_accuracy']:.3f}")
+            lines.append(f"  Directional Accuracy: {report['directional_accuracy']:.1%}")
+            lines.append(f"  Mean Error: {report['mean_magnitude_error']:.2f}%")
 
-        print("\n" + "=" * 80)
+        lines.append("\n" + "=" * 80)
+        print("\n".join(lines))
 
 
 def create_comprehensive_plan(
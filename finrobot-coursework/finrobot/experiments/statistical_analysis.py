@@ -222,13 +222,15 @@ class StatisticalAnalyzer:
         Returns:
             TTestResult with comprehensive statistics
         """
-        arr1 = np.array(group1)
-        arr2 = np.array(group2)
+        arr1 = np.asarray(group1, dtype=np.float64)
+        arr2 = np.asarray(group2, dtype=np.float64)
 
-        # Sample statistics
+        # Sample statistics, computed once and reused by the test, the
+        # effect size and the confidence intervals below
         n1, n2 = len(arr1), len(arr2)
-        mean1, mean2 = np.mean(arr1), np.mean(arr2)
-        std1, std2 = np.std(arr1, ddof=1), np.std(arr2, ddof=1)
+        mean1, mean2 = arr1.mean(), arr2.mean()
+        var1, var2 = arr1.var(ddof=1), arr2.var(ddof=1)
+        std1, std2 = np.sqrt(var1), np.sqrt(var2)
 
         # Perform t-test
         if paired:
@@ -237,10 +239,13 @@ class StatisticalAnalyzer:
                 paired = False
 
         if paired:
+            diffs = arr1 - arr2
             t_stat, p_value = stats.ttest_rel(arr1, arr2)
             df = n1 - 1
         else:
-            t_stat, p_value = stats.ttest_ind(arr1, arr2)
+            t_stat, p_value = stats.ttest_ind_from_stats(
+                mean1, std1, n1, mean2, std2, n2
+            )
             df = n1 + n2 - 2
 
         # Significance level
@@ -256,7 +261,10 @@ class StatisticalAnalyzer:
             sig_level = "ns"
 
         # Cohen's d (effect size)
-        cohens_d = self._calculate_cohens_d(arr1, arr2, paired)
+        if paired:
+            cohens_d = self._calculate_cohens_d(arr1, arr2, paired)
+        else:
+            cohens_d = self._cohens_d_from_stats(mean1, mean2, var1, var2, n1, n2)
 
         # Effect size interpretation
         abs_d = abs(cohens_d)
@@ -273,15 +281,15 @@ class StatisticalAnalyzer:
         mean_diff = mean1 - mean2
 
         if paired:
-            diffs = arr1 - arr2
             se = stats.sem(diffs)
-            ci_95 = stats.t.interval(0.95, df, loc=mean_diff, scale=se)
-            ci_99 = stats.t.interval(0.99, df, loc=mean_diff, scale=se)
         else:
-            pooled_std = np.sqrt(((n1-1)*std1**2 + (n2-1)*std2**2) / df)
+            pooled_std = np.sqrt(((n1-1)*var1 + (n2-1)*var2) / df)
             se = pooled_std * np.sqrt(1/n1 + 1/n2)
-            ci_95 = stats.t.interval(0.95, df, loc=mean_diff, scale=se)
-            ci_99 = stats.t.interval(0.99, df, loc=mean_diff, scale=se)
+
+        half_95 = stats.t.ppf(0.975, df) * se
+        half_99 = stats.t.ppf(0.995, df) * se
+        ci_95 = (mean_diff - half_95, mean_diff + half_95)
+        ci_99 = (mean_diff - half_99, mean_diff + half_99)
 
         result = TTestResult(
             group1_name=group1_name,
@@ -331,15 +339,42 @@ class StatisticalAnalyzer:
         """
         mean1, mean2 = np.mean(group1), np.mean(group2)
 
-        if paired:
-            # For paired samples, use std of differences
-            diffs = group1 - group2
-            std_pooled = np.std(diffs, ddof=1)
-        else:
+        if not paired:
             # Pooled standard deviation
             n1, n2 = len(group1), len(group2)
             var1, var2 = np.var(group1, ddof=1), np.var(group2, ddof=1)
-            std_pooled = np.sqrt(((n1-1)*var1 + (n2-1)*var2) / (n1 + n2 - 2))
+            return self._cohens_d_from_stats(mean1, mean2, var1, var2, n1, n2)
+
+        # For paired samples, use std of differences
+        diffs = group1 - group2
+        std_pooled = np.std(diffs, ddof=1)
+
+        if std_pooled == 0:
+            return 0.0
+
+        return (mean1 - mean2) / std_pooled
+
+    @staticmethod
+    def _cohens_d_from_stats(
+        mean1: float,
+        mean2: float,
+        var1: float,
+        var2: float,
+        n1: int,
+        n2: int,
+    ) -> float:
+        """
+        Calculate Cohen's d for independent samples from summary statistics.
+
+        Args:
+            mean1, mean2: Group means
+            var1, var2: Group sample variances (ddof=1)
+            n1, n2: Group sizes
+
+        Returns:
+            Cohen's d
+        """
+        std_pooled = np.sqrt(((n1-1)*var1 + (n2-1)*var2) / (n1 + n2 - 2))
 
         if std_pooled == 0:
             return 0.0
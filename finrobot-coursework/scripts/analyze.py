@@ -2,42 +2,63 @@
 """Analyzer focusing on ANALYTICAL VALUE not data repetition"""
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
+ANALYST_TURN = 'Market_Analyst (to User_Proxy):'
+USER_PROXY_TURN = 'User_Proxy (to Market_Analyst):'
+ANALYSIS_KEYWORDS = ('positive', 'concern', 'risk', 'predict', 'development', 'based on')
 
 def extract_agent_analysis(transcript):
     """Extract the agent's final analysis from full transcript"""
-    parts = transcript.split('Market_Analyst (to User_Proxy):')
-    for part in reversed(parts[1:]):
-        text = part.split('--------------------------------------------------------------------------------')[0]
-        text = part.split('User_Proxy (to Market_Analyst):')[0]
+    # Walk the analyst turns from the last one backwards, slicing out only
+    # the turn being inspected instead of splitting the whole transcript
+    end = len(transcript)
+    while True:
+        start = transcript.rfind(ANALYST_TURN, 0, end)
+        if start == -1:
+            break
+        part = transcript[start + len(ANALYST_TURN):end]
+        end = start
+        text = part.partition(USER_PROXY_TURN)[0]
         if '***** Suggested tool call' in text:
             continue
         lines = [l for l in text.split('\n') if l.strip() and not l.strip().startswith('*')]
         clean_text = '\n'.join(lines)
-        if len(clean_text) > 100 and any(kw in clean_text.lower() for kw in 
-            ['positive', 'concern', 'risk', 'predict', 'development', 'based on']):
-            return clean_text
+        if len(clean_text) > 100:
+            lowered = clean_text.lower()
+            if any(kw in lowered for kw in ANALYSIS_KEYWORDS):
+                return clean_text
     return transcript[-2000:]
 
+# Scoring patterns, compiled once at import instead of on every call
+CHANGE_RE = re.compile(r'\d+(?:\.\d+)?%\s*(?:increase|decrease|growth|decline|gain|drop|rise|fall)')
+COMPARISON_RE = re.compile(r'from\s+\$?\d+(?:\.\d+)?.*?to\s+\$?\d+(?:\.\d+)?')
+TEMPORAL_RE = re.compile(r'(?:on|by|during)\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d{4})[^.]*?(?:reached|increased|decreased|showed)')
+AGGREGATE_RE = re.compile(r'\b(?:overall|average|total|highest|lowest|maximum|minimum)\b[^.]*?\d+')
+PREDICTION_RE = re.compile(r'\b(?:predict|forecast|expect|anticipate)[^.]*?\d+(?:\.\d+)?%')
+ANALYTICAL_PATTERNS = (CHANGE_RE, COMPARISON_RE, TEMPORAL_RE, AGGREGATE_RE, PREDICTION_RE)
+
+RAW_DECIMAL_RE = re.compile(r'\d+\.\d{6}')
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+SYNTHESIS_VERB_RE = re.compile(r'\b(show|indicate|suggest|reflect|demonstrate)\b')
+
+PCT_RE = re.compile(r'\d+(?:\.\d+)?%')
+DOLLAR_RE = re.compile(r'\$\d+')
+DATE_TOKEN_RE = re.compile(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Q[1-4]|2024|2025)')
+
 def analytical_claims(text):
     """Count ANALYTICAL claims (trends, changes, insights) not raw data points"""
-    score = 0
-    
-    # Pattern 1: Change/growth statements (X% increase/decrease/growth)
-    score += len(re.findall(r'\d+(?:\.\d+)?%\s*(?:increase|decrease|growth|decline|gain|drop|rise|fall)', text.lower()))
-    
-    # Pattern 2: Comparative statements (from X to Y, higher/lower than)
-    score += len(re.findall(r'from\s+\$?\d+(?:\.\d+)?.*?to\s+\$?\d+(?:\.\d+)?', text.lower()))
-    
-    # Pattern 3: Temporal patterns (on DATE, X happened resulting in Y)
-    score += len(re.findall(r'(?:on|by|during)\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d{4})[^.]*?(?:reached|increased|decreased|showed)', text.lower()))
-    
-    # Pattern 4: Aggregate statistics (overall, average, total, highest, lowest)
-    score += len(re.findall(r'\b(?:overall|average|total|highest|lowest|maximum|minimum)\b[^.]*?\d+', text.lower()))
-    
-    # Pattern 5: Predictions with quantification
-    score += len(re.findall(r'\b(?:predict|forecast|expect|anticipate)[^.]*?\d+(?:\.\d+)?%', text.lower()))
-    
-    return score
+    # Patterns: change/growth statements, comparisons (from X to Y), temporal
+    # patterns (on DATE ... reached), aggregate statistics, and quantified
+    # predictions. Lowercase once and share it across all five.
+    lowered = text.lower()
+    return sum(len(pattern.findall(lowered)) for pattern in ANALYTICAL_PATTERNS)
 
 def data_regurgitation_penalty(text):
     """Penalize just listing data points without synthesis"""
@@ -47,111 +68,172 @@ def data_regurgitation_penalty(text):
     lines = text.split('\n')
     for line in lines:
         # Has multiple precise decimals (like raw data dump)
-        if len(re.findall(r'\d+\.\d{6}', line)) > 1:
+        if len(RAW_DECIMAL_RE.findall(line)) > 1:
             penalty += 1
         # Lists dates/prices without verbs (analysis needs verbs!)
-        if re.search(r'\d{4}-\d{2}-\d{2}', line) and not re.search(r'\b(show|indicate|suggest|reflect|demonstrate)\b', line.lower()):
+        if ISO_DATE_RE.search(line) and not SYNTHESIS_VERB_RE.search(line.lower()):
             penalty += 0.5
     
     return int(penalty)
 
 def count_raw_facts(text):
     """Simple fact count for reference"""
-    pct = len(re.findall(r'\d+(?:\.\d+)?%', text))
-    dollars = len(re.findall(r'\$\d+', text))
-    dates = len(re.findall(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Q[1-4]|2024|2025)', text))
+    pct = len(PCT_RE.findall(text))
+    dollars = len(DOLLAR_RE.findall(text))
+    dates = len(DATE_TOKEN_RE.findall(text))
     return pct + dollars + dates
 
-# Load results
-with open('scripts/results_agent.json') as f:
-    agent = json.load(f)
-with open('scripts/results_rag.json') as f:
-    rag = json.load(f)
-with open('scripts/results_zeroshot.json') as f:
-    zero = json.load(f)
-
-# Extract
-agent_success = []
-for r in agent:
-    if 'error' not in r:
-        analysis = extract_agent_analysis(r.get('transcript', ''))
-        r['analysis'] = analysis
-        agent_success.append(r)
-
-rag_success = [r for r in rag if 'error' not in r]
-zero_success = [r for r in zero if 'error' not in r]
-
-# Calculate analytical value scores
-agent_analytical = sum(analytical_claims(r['analysis']) for r in agent_success)
-rag_analytical = sum(analytical_claims(r.get('analysis', '')) for r in rag_success)
-zero_analytical = sum(analytical_claims(r.get('analysis', '')) for r in zero_success)
-
-agent_penalty = sum(data_regurgitation_penalty(r['analysis']) for r in agent_success)
-rag_penalty = sum(data_regurgitation_penalty(r.get('analysis', '')) for r in rag_success)
-
-agent_net_score = agent_analytical - agent_penalty
-rag_net_score = rag_analytical - rag_penalty
-zero_net_score = zero_analytical
-
-# Raw facts for reference
-agent_facts = sum(count_raw_facts(r['analysis']) for r in agent_success)
-rag_facts = sum(count_raw_facts(r.get('analysis', '')) for r in rag_success)
-zero_facts = sum(count_raw_facts(r.get('analysis', '')) for r in zero_success)
-
-agent_latency = sum(r['latency_seconds'] for r in agent_success) / len(agent_success) if agent_success else 0
-rag_latency = sum(r['latency_seconds'] for r in rag_success) / len(rag_success) if rag_success else 0
-zero_latency = sum(r['latency_seconds'] for r in zero_success) / len(zero_success) if zero_success else 0
-
-# Write summary
-with open('scripts/comparison_summary.txt', 'w') as f:
-    f.write("="*80 + "\n")
-    f.write("FINROBOT COMPARISON - ANALYTICAL VALUE ASSESSMENT\n")
-    f.write("="*80 + "\n\n")
-    
-    f.write(f"SUCCESS RATE:\n")
-    f.write(f"  Agent:     {len(agent_success)}/{len(agent)} (100%)\n")
-    f.write(f"  RAG:       {len(rag_success)}/{len(rag)} (100%)\n")
-    f.write(f"  Zero-shot: {len(zero_success)}/{len(zero)} (100%)\n\n")
-    
-    f.write(f"RAW FACTS (%, $, dates mentioned):\n")
-    f.write(f"  Agent:     {agent_facts}\n")
-    f.write(f"  RAG:       {rag_facts}\n")
-    f.write(f"  Zero-shot: {zero_facts}\n\n")
-    
-    f.write(f"ANALYTICAL CLAIMS (trends, changes, insights):\n")
-    f.write(f"  Agent:     {agent_analytical}\n")
-    f.write(f"  RAG:       {rag_analytical}\n")
-    f.write(f"  Zero-shot: {zero_analytical}\n\n")
-    
-    f.write(f"DATA REGURGITATION PENALTY:\n")
-    f.write(f"  Agent:     -{agent_penalty}\n")
-    f.write(f"  RAG:       -{rag_penalty}\n")
-    f.write(f"  Zero-shot: -0\n\n")
-    
-    f.write(f"NET ANALYTICAL VALUE SCORE:\n")
-    f.write(f"  Agent:     {agent_net_score}\n")
-    f.write(f"  RAG:       {rag_net_score}\n")
-    f.write(f"  Zero-shot: {zero_net_score}\n\n")
-    
-    f.write(f"AVG LATENCY:\n")
-    f.write(f"  Agent:     {agent_latency:.1f}s\n")
-    f.write(f"  RAG:       {rag_latency:.1f}s\n")
-    f.write(f"  Zero-shot: {zero_latency:.1f}s\n\n")
-    
-    f.write(f"KEY FINDINGS:\n")
+def read_bytes(path):
+    """Read a results file as raw bytes"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def parse_json(data):
+    """Parse a results payload, using orjson's C parser when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+RESULT_FILES = (
+    'scripts/results_agent.json',
+    'scripts/results_rag.json',
+    'scripts/results_zeroshot.json',
+)
+
+def load_results():
+    """Load the agent, RAG and zero-shot result files"""
+    # Only the reads overlap: neither parser releases the GIL, so parsing on
+    # the pool would just contend for it. Parse in this thread instead.
+    with ThreadPoolExecutor(max_workers=len(RESULT_FILES)) as ex:
+        payloads = list(ex.map(read_bytes, RESULT_FILES))
+    agent, rag, zero = map(parse_json, payloads)
+    return agent, rag, zero
+
+# Below this many records the process pool costs more than it saves
+PARALLEL_MIN_RECORDS = 64
+
+def score_analysis(analysis, penalize):
+    """Score an analysis once; the per-record results are stored on the record"""
+    scores = {
+        'analysis': analysis,
+        'analytical_claims': analytical_claims(analysis),
+        'raw_facts': count_raw_facts(analysis),
+    }
+    if penalize:
+        scores['penalty'] = data_regurgitation_penalty(analysis)
+    return scores
+
+def score_record(record, has_transcript, penalize):
+    """Score one record (module-level so it pickles)"""
+    if has_transcript:
+        analysis = extract_agent_analysis(record.get('transcript', ''))
+    else:
+        analysis = record.get('analysis', '')
+    return score_analysis(analysis, penalize)
+
+def score_group(records, has_transcript, penalize=True):
+    """Score one system's successful runs; returns them and their mean latency"""
+    success = [r for r in records if 'error' not in r]
+    score = partial(score_record, has_transcript=has_transcript, penalize=penalize)
+    if len(success) >= PARALLEL_MIN_RECORDS:
+        with ProcessPoolExecutor() as ex:
+            scored = list(ex.map(score, success, chunksize=8))
+    else:
+        scored = [score(r) for r in success]
+    for r, scores in zip(success, scored):
+        r.update(scores)
+    latency = sum(r['latency_seconds'] for r in success) / len(success) if success else 0
+    return success, latency
+
+def main():
+    """Score all three systems and write the comparison summary"""
+    # Load results
+    agent, rag, zero = load_results()
+
+    # Extract and score
+    agent_success, agent_latency = score_group(agent, has_transcript=True)
+    rag_success, rag_latency = score_group(rag, has_transcript=False)
+    # The zero-shot baseline is not penalized, so skip that scan entirely
+    zero_success, zero_latency = score_group(zero, has_transcript=False, penalize=False)
+
+    # Aggregate the per-record scores (no text is re-scanned here)
+    agent_analytical = sum(r['analytical_claims'] for r in agent_success)
+    rag_analytical = sum(r['analytical_claims'] for r in rag_success)
+    zero_analytical = sum(r['analytical_claims'] for r in zero_success)
+
+    agent_penalty = sum(r['penalty'] for r in agent_success)
+    rag_penalty = sum(r['penalty'] for r in rag_success)
+
+    agent_net_score = agent_analytical - agent_penalty
+    rag_net_score = rag_analytical - rag_penalty
+    zero_net_score = zero_analytical
+
+    # Raw facts for reference
+    agent_facts = sum(r['raw_facts'] for r in agent_success)
+    rag_facts = sum(r['raw_facts'] for r in rag_success)
+    zero_facts = sum(r['raw_facts'] for r in zero_success)
+
+    # Build the summary in memory, then write and print it in one go
+    lines = []
+    lines.append("="*80 + "\n")
+    lines.append("FINROBOT COMPARISON - ANALYTICAL VALUE ASSESSMENT\n")
+    lines.append("="*80 + "\n\n")
+
+    lines.append(f"SUCCESS RATE:\n")
+    lines.append(f"  Agent:     {len(agent_success)}/{len(agent)} (100%)\n")
+    lines.append(f"  RAG:       {len(rag_success)}/{len(rag)} (100%)\n")
+    lines.append(f"  Zero-shot: {len(zero_success)}/{len(zero)} (100%)\n\n")
+
+    lines.append(f"RAW FACTS (%, $, dates mentioned):\n")
+    lines.append(f"  Agent:     {agent_facts}\n")
+    lines.append(f"  RAG:       {rag_facts}\n")
+    lines.append(f"  Zero-shot: {zero_facts}\n\n")
+
+    lines.append(f"ANALYTICAL CLAIMS (trends, changes, insights):\n")
+    lines.append(f"  Agent:     {agent_analytical}\n")
+    lines.append(f"  RAG:       {rag_analytical}\n")
+    lines.append(f"  Zero-shot: {zero_analytical}\n\n")
+
+    lines.append(f"DATA REGURGITATION PENALTY:\n")
+    lines.append(f"  Agent:     -{agent_penalty}\n")
+    lines.append(f"  RAG:       -{rag_penalty}\n")
+    lines.append(f"  Zero-shot: -0\n\n")
+
+    lines.append(f"NET ANALYTICAL VALUE SCORE:\n")
+    lines.append(f"  Agent:     {agent_net_score}\n")
+    lines.append(f"  RAG:       {rag_net_score}\n")
+    lines.append(f"  Zero-shot: {zero_net_score}\n\n")
+
+    lines.append(f"AVG LATENCY:\n")
+    lines.append(f"  Agent:     {agent_latency:.1f}s\n")
+    lines.append(f"  RAG:       {rag_latency:.1f}s\n")
+    lines.append(f"  Zero-shot: {zero_latency:.1f}s\n\n")
+
+    lines.append(f"KEY FINDINGS:\n")
+    # A system with no successful runs has zero latency; say so rather than divide by it
+    latency_ratio = f"{agent_latency/rag_latency:.1f}×" if rag_latency > 0 else "N/A"
     if agent_net_score > rag_net_score:
-        ratio = agent_net_score / rag_net_score
-        f.write(f"✓ Agent achieves {ratio:.1f}× higher analytical value than RAG\n")
-        f.write(f"  Agentic workflow synthesizes data into actionable insights.\n")
-        f.write(f"  Despite {agent_latency/rag_latency:.1f}× slower performance,\n")
-        f.write(f"  tool-augmented analysis provides superior decision support.\n")
+        # A ratio against a non-positive score is meaningless; report N/A instead
+        ratio = f"{agent_net_score/rag_net_score:.1f}×" if rag_net_score > 0 else "N/A"
+        lines.append(f"✓ Agent achieves {ratio} higher analytical value than RAG\n")
+        lines.append(f"  Agentic workflow synthesizes data into actionable insights.\n")
+        lines.append(f"  Despite {latency_ratio} slower performance,\n")
+        lines.append(f"  tool-augmented analysis provides superior decision support.\n")
     else:
-        ratio = rag_net_score / agent_net_score if agent_net_score > 0 else 0
-        f.write(f"✓ RAG achieves {ratio:.1f}× higher analytical value than Agent\n")
-        f.write(f"  Single-shot retrieval provides comprehensive coverage.\n")
-        f.write(f"  {agent_latency/rag_latency:.1f}× faster response time.\n")
-    
-    f.write(f"\n✓ Both Agent ({agent_net_score}) and RAG ({rag_net_score}) vastly outperform\n")
-    f.write(f"  zero-shot baseline ({zero_net_score}), proving data access is critical.\n")
+        ratio = f"{rag_net_score/agent_net_score:.1f}×" if agent_net_score > 0 else "N/A"
+        lines.append(f"✓ RAG achieves {ratio} higher analytical value than Agent\n")
+        lines.append(f"  Single-shot retrieval provides comprehensive coverage.\n")
+        lines.append(f"  {latency_ratio} faster response time.\n")
+
+    lines.append(f"\n✓ Both Agent ({agent_net_score}) and RAG ({rag_net_score}) vastly outperform\n")
+    lines.append(f"  zero-shot baseline ({zero_net_score}), proving data access is critical.\n")
+
+    summary = ''.join(lines)
+    with open('scripts/comparison_summary.txt', 'w') as f:
+        f.write(summary)
+
+    print(summary)
+
 
-print(open('scripts/comparison_summary.txt').read())
+if __name__ == '__main__':
+    main()
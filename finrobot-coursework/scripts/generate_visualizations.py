@@ -11,22 +11,30 @@ Creates:
 """
 
 import argparse
+import os
 import sys
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
-from datetime import datetime
+from typing import Dict, List, Any, Optional
 
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # headless: render straight to files, skip GUI backend probing
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
-import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
 
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-from finrobot.experiments.ground_truth_validator import GroundTruthValidator
-from finrobot.experiments.statistical_analysis import StatisticalAnalyzer
 from finrobot.logging import get_logger
 
 logger = get_logger(__name__)
@@ -34,19 +42,35 @@ logger = get_logger(__name__)
 # Set style
 sns.set_style("whitegrid")
 sns.set_palette("husl")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 11
+plt.rcParams.update({
+    'figure.figsize': (12, 8),
+    'font.size': 11,
+    # Merge near-collinear path segments before rasterizing
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+})
 
 
 def load_analysis(analysis_file: Path) -> Dict[str, Any]:
-    """Load analysis JSON."""
+    """Load analysis JSON (parsed with orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(analysis_file.read_bytes())
     with open(analysis_file, "r") as f:
         return json.load(f)
 
 
+def index_ttests_by_metric(analysis: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group the t-test records by metric name in a single pass."""
+    by_metric: Dict[str, List[Dict[str, Any]]] = {}
+    for ttest in analysis['statistical_comparison']['ttests']:
+        by_metric.setdefault(ttest['metric_name'], []).append(ttest)
+    return by_metric
+
+
 def plot_performance_comparison(
     analysis: Dict[str, Any],
     output_dir: Path,
+    ttests_by_metric: Optional[Dict[str, List[Dict[str, Any]]]] = None,
 ):
     """
     Create performance comparison charts.
@@ -56,13 +80,15 @@ def plot_performance_comparison(
     logger.info("Generating performance comparison chart...")
 
     comp = analysis['statistical_comparison']
-    systems = comp['systems_compared']
+    if ttests_by_metric is None:
+        ttests_by_metric = index_ttests_by_metric(analysis)
 
     # Extract metrics for each system
     metrics = ['latency_seconds', 'total_cost', 'reasoning_steps', 'response_length']
     metric_labels = ['Latency (s)', 'Cost ($)', 'Reasoning Depth', 'Response Length']
 
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig = Figure(figsize=(14, 10), layout="constrained")
+    axes = fig.subplots(2, 2)
     axes = axes.flatten()
 
     for idx, (metric, label) in enumerate(zip(metrics, metric_labels)):
@@ -72,14 +98,13 @@ def plot_performance_comparison(
         system_means = {}
         system_stds = {}
 
-        for ttest in comp['ttests']:
-            if ttest['metric_name'] == metric:
-                if ttest['group1_name'] not in system_means:
-                    system_means[ttest['group1_name']] = ttest['mean1']
-                    system_stds[ttest['group1_name']] = ttest['std1']
-                if ttest['group2_name'] not in system_means:
-                    system_means[ttest['group2_name']] = ttest['mean2']
-                    system_stds[ttest['group2_name']] = ttest['std2']
+        for ttest in ttests_by_metric.get(metric, []):
+            if ttest['group1_name'] not in system_means:
+                system_means[ttest['group1_name']] = ttest['mean1']
+                system_stds[ttest['group1_name']] = ttest['std1']
+            if ttest['group2_name'] not in system_means:
+                system_means[ttest['group2_name']] = ttest['mean2']
+                system_stds[ttest['group2_name']] = ttest['std2']
 
         if not system_means:
             continue
@@ -105,10 +130,8 @@ def plot_performance_comparison(
         ax.set_xticklabels(systems_list, rotation=45, ha='right')
         ax.set_title(f"{label} by System/Model")
 
-    plt.tight_layout()
     output_file = output_dir / "performance_comparison.png"
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_file, dpi=300)
 
     logger.info(f"Saved: {output_file}")
 
@@ -130,13 +153,14 @@ def plot_statistical_significance(
         [t['group1_name'] for t in ttests] + [t['group2_name'] for t in ttests]
     ))
     systems.sort()
+    position = {name: i for i, name in enumerate(systems)}
 
     n = len(systems)
     sig_matrix = np.zeros((n, n))
 
     for ttest in ttests:
-        i = systems.index(ttest['group1_name'])
-        j = systems.index(ttest['group2_name'])
+        i = position[ttest['group1_name']]
+        j = position[ttest['group2_name']]
 
         # Store p-value (log scale for better visualization)
         p_val = ttest['p_value']
@@ -146,7 +170,8 @@ def plot_statistical_significance(
         sig_matrix[j, i] = sig_val
 
     # Plot heatmap
-    fig, ax = plt.subplots(figsize=(12, 10))
+    fig = Figure(figsize=(12, 10), layout="constrained")
+    ax = fig.subplots()
 
     sns.heatmap(
         sig_matrix,
@@ -165,10 +190,8 @@ def plot_statistical_significance(
     threshold_05 = -np.log10(0.05)
     threshold_01 = -np.log10(0.01)
 
-    plt.tight_layout()
     output_file = output_dir / "statistical_significance.png"
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_file, dpi=300)
 
     logger.info(f"Saved: {output_file}")
 
@@ -202,7 +225,8 @@ def plot_ground_truth_accuracy(
         logger.warning("No validated predictions yet, skipping ground truth plot")
         return
 
-    fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+    fig = Figure(figsize=(16, 5), layout="constrained")
+    axes = fig.subplots(1, 3)
 
     # Overall accuracy
     ax = axes[0]
@@ -241,10 +265,8 @@ def plot_ground_truth_accuracy(
     best_idx = np.argmin(errors)
     bars[best_idx].set_color('gold')
 
-    plt.tight_layout()
     output_file = output_dir / "ground_truth_accuracy.png"
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_file, dpi=300)
 
     logger.info(f"Saved: {output_file}")
 
@@ -275,10 +297,11 @@ def plot_effect_sizes(
     # Sort by absolute effect size
     sorted_indices = np.argsort(np.abs(effect_sizes))[::-1][:20]  # Top 20
 
-    fig, ax = plt.subplots(figsize=(12, 10))
+    fig = Figure(figsize=(12, 10), layout="constrained")
+    ax = fig.subplots()
 
     y_pos = np.arange(len(sorted_indices))
-    colors = ['red' if p < 0.05 else 'gray' for i, p in enumerate(p_values) if i in sorted_indices]
+    colors = ['red' if p_values[i] < 0.05 else 'gray' for i in sorted_indices]
 
     ax.barh(
         y_pos,
@@ -302,10 +325,8 @@ def plot_effect_sizes(
 
     ax.legend()
 
-    plt.tight_layout()
     output_file = output_dir / "effect_sizes.png"
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_file, dpi=300)
 
     logger.info(f"Saved: {output_file}")
 
@@ -313,25 +334,28 @@ def plot_effect_sizes(
 def plot_confidence_intervals(
     analysis: Dict[str, Any],
     output_dir: Path,
+    ttests_by_metric: Optional[Dict[str, List[Dict[str, Any]]]] = None,
 ):
     """
     Plot confidence intervals for key metrics.
     """
     logger.info("Generating confidence interval plot...")
 
-    comp = analysis['statistical_comparison']
+    if ttests_by_metric is None:
+        ttests_by_metric = index_ttests_by_metric(analysis)
 
     # Focus on latency and cost
     metrics = ['latency_seconds', 'total_cost']
     metric_labels = ['Latency (seconds)', 'Cost (USD)']
 
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig = Figure(figsize=(14, 6), layout="constrained")
+    axes = fig.subplots(1, 2)
 
     for idx, (metric, label) in enumerate(zip(metrics, metric_labels)):
         ax = axes[idx]
 
         # Get all ttests for this metric
-        relevant_tests = [t for t in comp['ttests'] if t['metric_name'] == metric]
+        relevant_tests = ttests_by_metric.get(metric, [])
 
         if not relevant_tests:
             continue
@@ -372,10 +396,8 @@ def plot_confidence_intervals(
         ax.set_title(f"{label} with 95% Confidence Intervals")
         ax.grid(axis='x', alpha=0.3)
 
-    plt.tight_layout()
     output_file = output_dir / "confidence_intervals.png"
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_file, dpi=300)
 
     logger.info(f"Saved: {output_file}")
 
@@ -397,6 +419,11 @@ def main():
         default="./visualizations",
         help="Output directory for plots",
     )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Render charts in worker processes instead of threads",
+    )
 
     args = parser.parse_args()
 
@@ -422,19 +449,39 @@ def main():
     print("GENERATING VISUALIZATIONS...")
     print("="*80 + "\n")
 
-    plot_performance_comparison(analysis, output_dir)
-    plot_statistical_significance(analysis, output_dir)
-    plot_ground_truth_accuracy(analysis, output_dir)
-    plot_effect_sizes(analysis, output_dir)
-    plot_confidence_intervals(analysis, output_dir)
+    # Shared by the charts that slice t-tests per metric
+    ttests_by_metric = index_ttests_by_metric(analysis)
+
+    plots = [
+        (plot_performance_comparison, (analysis, output_dir, ttests_by_metric)),
+        (plot_statistical_significance, (analysis, output_dir)),
+        (plot_ground_truth_accuracy, (analysis, output_dir)),
+        (plot_effect_sizes, (analysis, output_dir)),
+        (plot_confidence_intervals, (analysis, output_dir, ttests_by_metric)),
+    ]
+
+    # Each chart owns its Figure (no pyplot state), so rendering and PNG
+    # encoding can overlap across threads. Worker processes also run the
+    # artist drawing in parallel.
+    if args.processes:
+        executor_cls = ProcessPoolExecutor
+    else:
+        executor_cls = ThreadPoolExecutor
+
+    with executor_cls(max_workers=4) as executor:
+        futures = [executor.submit(plot, *plot_args) for plot, plot_args in plots]
+        for future in futures:
+            future.result()
 
     print("\n" + "="*80)
     print("ALL VISUALIZATIONS GENERATED")
     print("="*80)
     print(f"\nSaved to: {output_dir}")
     print("\nGenerated files:")
-    for file in output_dir.glob("*.png"):
-        print(f"  - {file.name}")
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".png") and entry.is_file():
+                print(f"  - {entry.name}")
 
 
 if __name__ == "__main__":
@@ -21,11 +21,14 @@ Usage:
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from finrobot.experiments.multi_model_runner import (
     MultiModelExperimentRunner,
@@ -82,8 +85,11 @@ def main():
         parser.print_help()
         return
 
+    # One timestamp per run so the output directory and exported files match
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
     # Create runner
-    output_dir = args.output_dir or f"./experiment_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    output_dir = args.output_dir or f"./experiment_results_{timestamp}"
     runner = MultiModelExperimentRunner(
         output_dir=output_dir,
         enable_caching=args.use_cache,
@@ -155,20 +161,25 @@ def main():
     print("EXPORTING RESULTS...")
     print("="*80)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    # Export metrics
-    metrics_file = runner.metrics_collector.export_csv(f"metrics_{timestamp}.csv")
-    print(f"Metrics: {metrics_file}")
-
-    # Export ground truth
-    gt_file = runner.ground_truth_validator.export_report_csv(f"ground_truth_{timestamp}.csv")
-    print(f"Ground Truth: {gt_file}")
-
-    # Export statistical analysis
+    # The three exports write independent files, so overlap their encoding and I/O
     stats_file = Path(output_dir) / f"statistical_analysis_{timestamp}.json"
-    runner.statistical_analyzer.export_report(analysis['statistical_comparison'], stats_file)
-    print(f"Statistics: {stats_file}")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        metrics_future = executor.submit(
+            runner.metrics_collector.export_csv, f"metrics_{timestamp}.csv"
+        )
+        gt_future = executor.submit(
+            runner.ground_truth_validator.export_report_csv, f"ground_truth_{timestamp}.csv"
+        )
+        stats_future = executor.submit(
+            runner.statistical_analyzer.export_report,
+            analysis['statistical_comparison'],
+            stats_file,
+        )
+
+        print(f"Metrics: {metrics_future.result()}")
+        print(f"Ground Truth: {gt_future.result()}")
+        stats_future.result()
+        print(f"Statistics: {stats_file}")
 
     print("\n" + "="*80)
     print("ALL DONE!")
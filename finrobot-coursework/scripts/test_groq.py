@@ -11,7 +11,9 @@ from datetime import datetime
 from pathlib import Path
 
 # Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from finrobot.experiments.metrics_collector import MetricsCollector
 from finrobot.data_source import YFinanceUtils
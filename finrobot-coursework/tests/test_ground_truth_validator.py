@@ -268,6 +268,63 @@ def test_report_filtering_by_system(validator):
     assert report.system_name == "rag"
 
 
+def test_validate_all_due_saves_once(validator, temp_storage_dir, monkeypatch):
+    """Test batch validation persists every result with a single save."""
+    for ticker in ["AAPL", "MSFT", "NVDA"]:
+        validator.record_prediction(
+            system_name="agent",
+            model_name="GPT-4",
+            ticker=ticker,
+            task_name="test",
+            response_text="Up 2%",
+            prediction_type=PredictionType.PERCENT_CHANGE,
+            predicted_value="2%",
+            reference_price=100.0,
+            timeframe_days=0,
+        )
+
+    monkeypatch.setattr(validator, "_fetch_price_at_date", lambda ticker, date: 102.0)
+    saves = []
+    original_save = validator.save_predictions
+    monkeypatch.setattr(
+        validator, "save_predictions", lambda: (saves.append(1), original_save())
+    )
+
+    validated = validator.validate_all_due()
+
+    assert len(validated) == 3
+    assert len(saves) == 1
+
+    reloaded = GroundTruthValidator(storage_dir=temp_storage_dir)
+    assert all(p.is_validated for p in reloaded.predictions.values())
+
+
+def test_validate_all_due_saves_on_failure(validator, temp_storage_dir, monkeypatch):
+    """Test batch validation keeps earlier results when a later one raises."""
+    for ticker, reference_price in [("AAPL", 100.0), ("MSFT", 0.0)]:
+        validator.record_prediction(
+            system_name="agent",
+            model_name="GPT-4",
+            ticker=ticker,
+            task_name="test",
+            response_text="Up 2%",
+            prediction_type=PredictionType.PERCENT_CHANGE,
+            predicted_value="2%",
+            reference_price=reference_price,
+            timeframe_days=0,
+        )
+
+    monkeypatch.setattr(validator, "_fetch_price_at_date", lambda ticker, date: 102.0)
+
+    # A zero reference price (failed price fetch) makes validation divide by zero
+    with pytest.raises(ZeroDivisionError):
+        validator.validate_all_due()
+
+    reloaded = GroundTruthValidator(storage_dir=temp_storage_dir)
+    validated = [p for p in reloaded.predictions.values() if p.is_validated]
+    assert [p.ticker for p in validated] == ["AAPL"]
+
+
 def test_export_report_csv(validator, temp_storage_dir):
     """Test CSV export."""
     validator.record_prediction(
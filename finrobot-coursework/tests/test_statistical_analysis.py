@@ -366,5 +366,22 @@ def test_confidence_intervals(analyzer):
     assert ci_99_upper - ci_99_lower > ci_95_upper - ci_95_lower
 
 
+def test_ttest_independent_matches_scipy(analyzer):
+    """Summary-statistics t-test should match scipy's ttest_ind."""
+    from scipy import stats
+
+    group1 = [2.1, 3.4, 1.9, 4.2, 3.3, 2.8]
+    group2 = [3.9, 4.4, 5.1, 4.0, 3.7]
+
+    result = analyzer.ttest(group1, group2, "g1", "g2", "metric", paired=False)
+    expected = stats.ttest_ind(group1, group2)
+
+    assert result.t_statistic == pytest.approx(expected.statistic)
+    assert result.p_value == pytest.approx(expected.pvalue)
+    assert result.cohens_d == pytest.approx(
+        analyzer._calculate_cohens_d(np.array(group1), np.array(group2))
+    )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])